@@ -83,16 +83,17 @@ class ColorWindow:
                 self.reset(self.gui)
             text = ''
         else:
-            scalars = np.ma.array([self.gui.get_color_scalars(i)
-                                   for i in range(len(self.gui.images))])
+            # get_color_scalars() only looks at the current frame, so
+            # evaluating it once per image would just repeat the same work:
+            scalars = np.ma.array(self.gui.get_color_scalars())
             mn = np.min(scalars)
             mx = np.max(scalars)
             self.gui.colormode_data = None, mn, mx
 
             cmaps = ['default', 'old']
             try:
-                import pylab as plt
-                cmaps += [m for m in plt.cm.datad if not m.endswith("_r")]
+                from matplotlib import cm
+                cmaps += [m for m in cm.datad if not m.endswith("_r")]
             except ImportError:
                 pass
             self.cmaps = [_('cmap:'),
@@ -146,18 +147,18 @@ class ColorWindow:
             N = 26
         colorscale, mn, mx = self.gui.colormode_data
         if cmap == 'default':
-            colorscale = ['#{0:02X}80{0:02X}'.format(int(red))
-                          for red in np.linspace(0, 250, N)]
+            colorscale = ['#{0:02X}80{0:02X}'.format(red)
+                          for red in np.linspace(0, 250, N).astype(int)]
         elif cmap == 'old':
-            colorscale = ['#{0:02X}AA00'.format(int(red))
-                          for red in np.linspace(0, 230, N)]
+            colorscale = ['#{0:02X}AA00'.format(red)
+                          for red in np.linspace(0, 230, N).astype(int)]
         else:
             try:
-                import pylab as plt
-                import matplotlib
-                cmap = plt.cm.get_cmap(cmap)
-                colorscale = [matplotlib.colors.rgb2hex(c[:3]) for c in
-                              cmap(np.linspace(0, 1, N))]
+                from matplotlib import cm
+                cmap = cm.get_cmap(cmap)
+                rgbs = np.round(cmap(np.linspace(0, 1, N))[:, :3] * 255)
+                colorscale = ['#{0:02x}{1:02x}{2:02x}'.format(*rgb)
+                              for rgb in rgbs.astype(int)]
             except (ImportError, ValueError) as e:
                 raise RuntimeError('Can not load colormap {0}: {1}'.format(
                     cmap, str(e)))
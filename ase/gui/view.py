@@ -18,6 +18,11 @@ GREEN = '#74DF00'
 PURPLE = '#AC58FA'
 BLACKISH = '#151515'
 
+# Hex strings for the default jmol colors, indexed by atomic number:
+JMOL_COLORS = {Z: ('#{0:02X}{1:02X}{2:02X}'
+                   .format(*(int(x * 255) for x in rgb)))
+               for Z, rgb in enumerate(jmol_colors)}
+
 
 def get_cell_coordinates(cell, shifted=False):
     """Get start and end points of lines segments used to draw cell."""
@@ -91,11 +96,7 @@ class View:
 
         # XXX
         self.colormode = 'jmol'
-        self.colors = {}
-
-        for i, rgb in enumerate(jmol_colors):
-            self.colors[i] = ('#{0:02X}{1:02X}{2:02X}'
-                              .format(*(int(x * 255) for x in rgb)))
+        self.colors = JMOL_COLORS.copy()
 
         # scaling factors for vectors
         self.force_vector_scale = self.config['force_vector_scale']
@@ -333,15 +334,22 @@ class View:
 
     def get_colors(self, rgb=False):
         if rgb:
-            return [tuple(int(_rgb[i:i + 2], 16) / 255 for i in range(1, 7, 2))
-                    for _rgb in self.get_colors()]
-
-        if self.colormode == 'jmol':
-            return [self.colors.get(Z, BLACKISH) for Z in self.atoms.numbers]
-
-        if self.colormode == 'neighbors':
-            return [self.colors.get(Z, BLACKISH)
-                    for Z in self.get_color_scalars()]
+            colors = self.get_colors()
+            # Only a handful of distinct colors; convert each of them once:
+            rgbs = {_rgb: tuple(int(_rgb[i:i + 2], 16) / 255
+                                for i in range(1, 7, 2))
+                    for _rgb in set(colors)}
+            return [rgbs[_rgb] for _rgb in colors]
+
+        if self.colormode in ('jmol', 'neighbors'):
+            if self.colormode == 'jmol':
+                keys = self.atoms.numbers
+            else:
+                keys = self.get_color_scalars()
+            # Look up each distinct key only once:
+            keys, inverse = np.unique(keys, return_inverse=True)
+            colors = [self.colors.get(key, BLACKISH) for key in keys]
+            return [colors[i] for i in inverse]
 
         colorscale, cmin, cmax = self.colormode_data
         N = len(colorscale)
@@ -60,11 +60,11 @@ class GaussianProcess():
         self.X = X.copy()  # Store the data in an attribute
         n = self.X.shape[0]
         D = self.X.shape[1]
-        regularization = np.array(n * ([self.noise * self.kernel.l] +
-                                  D * [self.noise]))
+        regularization = np.full((n, D + 1), self.noise)
+        regularization[:, 0] *= self.kernel.l
 
         K = self.kernel.kernel_matrix(X)  # Compute the kernel matrix
-        K[range(K.shape[0]), range(K.shape[0])] += regularization**2
+        K.flat[::len(K) + 1] += regularization.ravel()**2  # Add to diagonal
 
         self.m = self.prior.prior(X)
         self.a = Y.flatten() - self.m
@@ -90,8 +90,10 @@ class GaussianProcess():
         k = self.kernel.kernel_vector(x, self.X, n)
         f = self.prior.prior(x) + np.dot(k, self.a)
         if get_variance:
-            v = solve_triangular(self.L, k.T.copy(), lower=True,
-                                 check_finite=False)
+            # k.T is Fortran-ordered like self.L, so LAPACK can solve in
+            # place without copying either of them:
+            v = solve_triangular(self.L, k.T, lower=True,
+                                 overwrite_b=True, check_finite=False)
             variance = self.kernel.kernel(x, x)
             # covariance = np.matmul(v.T, v)
             covariance = np.tensordot(v, v, axes=(0, 0))
@@ -124,13 +126,13 @@ class GaussianProcess():
         # Gradient of the loglikelihood
         grad = self.kernel.gradient(X)
 
-        # vectorizing the derivative of the log likelihood
-        D_P_input = np.array([np.dot(np.outer(self.a, self.a), g)
-                              for g in grad])
-        D_complexity = np.array([cho_solve((self.L, self.lower), g)
-                                 for g in grad])
-
-        DlogP = 0.5 * np.trace(D_P_input - D_complexity, axis1=1, axis2=2)
+        # Derivative of the log likelihood: only the traces of
+        # (a a^T - K^-1) dK/dp are needed, so invert K once with its
+        # Cholesky factor instead of solving and multiplying per parameter
+        K_inv = cho_solve((self.L, self.lower), np.identity(len(self.a)),
+                          check_finite=False)
+        DlogP = 0.5 * np.array([np.dot(self.a, np.dot(g, self.a)) -
+                                np.sum(K_inv * g.T) for g in grad])
         return -logP, -DlogP
 
     def fit_hyperparameters(self, X, Y, tol=1e-2, eps=None):
@@ -215,28 +215,33 @@ class GPMin(Optimizer, GaussianProcess):
         # update the training set
         self.x_list.append(r)
         f = f.reshape(-1)
-        y = np.append(np.array(e).reshape(-1), -f)
+        y = np.empty(len(f) + 1)
+        y[0] = e
+        y[1:] = -f
         self.y_list.append(y)
 
         # Set/update the constant for the prior
         if self.update_prior:
             if self.strategy == 'average':
-                av_e = np.mean(np.array(self.y_list)[:, 0])
+                av_e = np.mean([y[0] for y in self.y_list])
                 self.prior.set_constant(av_e)
             elif self.strategy == 'maximum':
-                max_e = np.max(np.array(self.y_list)[:, 0])
+                max_e = max(y[0] for y in self.y_list)
                 self.prior.set_constant(max_e)
             elif self.strategy == 'init':
                 self.prior.set_constant(e)
                 self.update_prior = False
 
+        X = np.array(self.x_list)
+        Y = np.array(self.y_list)
+
         # update hyperparams
         if (self.update_hp and self.function_calls % self.nbatch == 0 and
            self.function_calls != 0):
-            self.fit_to_batch()
+            self.fit_to_batch(X, Y)
 
         # build the model
-        self.train(np.array(self.x_list), np.array(self.y_list))
+        self.train(X, Y)
 
     def relax_model(self, r0):
         result = minimize(self.acquisition, r0, method='L-BFGS-B', jac=True)
@@ -247,11 +252,16 @@ class GPMin(Optimizer, GaussianProcess):
             raise RuntimeError("The minimization of the acquisition function "
                                "has not converged")
 
-    def fit_to_batch(self):
-        """Fit hyperparameters keeping the ratio noise/weight fixed"""
+    def fit_to_batch(self, X=None, Y=None):
+        """Fit hyperparameters keeping the ratio noise/weight fixed
+
+        X and Y default to the arrays of the current training set."""
+        if X is None:
+            X = np.array(self.x_list)
+        if Y is None:
+            Y = np.array(self.y_list)
         ratio = self.noise/self.kernel.weight
-        self.fit_hyperparameters(np.array(self.x_list),
-                                 np.array(self.y_list), eps=self.eps)
+        self.fit_hyperparameters(X, Y, eps=self.eps)
         self.noise = ratio*self.kernel.weight
 
     def step(self, f=None):
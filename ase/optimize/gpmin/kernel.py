@@ -120,40 +120,67 @@ class SquaredExponential(SE_kernel):
         This function returns a D+1 x D+1 matrix, where D is the dimension of
         the manifold.
         """
+        # Evaluate the scaled difference once and reuse it for the value,
+        # gradient and hessian blocks:
+        d = (x1 - x2) / self.l
         K = np.identity(self.D+1)
-        K[0, 1:] = self.kernel_function_gradient(x1, x2)
+        K[0, 1:] = d / self.l
         K[1:, 0] = -K[0, 1:]
-        # K[1:,1:] = self.kernel_function_hessian(x1, x2)
-        P = np.outer(x1-x2, x1-x2)/self.l**2
-        K[1:, 1:] = (K[1:, 1:]-P)/self.l**2
-        # return np.block([[k,j2],[j1,h]])*self.kernel_function(x1, x2)
-        return K * self.kernel_function(x1, x2)
+        K[1:, 1:] = (K[1:, 1:] - np.outer(d, d)) / self.l**2
+        return K * self.weight**2 * np.exp(-0.5 * np.dot(d, d))
 
     def kernel_matrix(self, X):
         """This is the same method than self.K for X1=X2, but using the matrix
         is then symmetric.
         """
-        n, D = np.atleast_2d(X).shape
-        K = np.identity(n * (D + 1))
+        X = np.atleast_2d(X)
+        n, D = X.shape
         self.D = D
         D1 = D + 1
 
-        # fill upper triangular:
-        for i in range(n):
-            for j in range(i + 1, n):
-                k = self.kernel(X[i], X[j])
-                K[i * D1:(i + 1) * D1, j * D1:(j + 1) * D1] = k
-                K[j * D1:(j + 1) * D1, i * D1:(i + 1) * D1] = k.T
-            K[i * D1:(i + 1) * D1, i * D1:(i + 1) * D1] = self.kernel(X[i], X[i])
-        return K
+        # Scaled differences (x_i - x_j) / l for all pairs at once:
+        diff = (X[:, np.newaxis, :] - X[np.newaxis, :, :]) / self.l
+        k = self.weight**2 * np.exp(-0.5 * np.sum(diff**2, axis=2))
+
+        # Block (i, j) of K is K[i, :, j, :] = self.kernel(X[i], X[j]):
+        K = np.empty((n, D1, n, D1))
+        K[:, 0, :, 0] = 1
+        K[:, 0, :, 1:] = diff / self.l
+        K[:, 1:, :, 0] = -diff.transpose(0, 2, 1) / self.l
+        H = K[:, 1:, :, 1:]
+        np.multiply(diff.transpose(0, 2, 1)[:, :, :, np.newaxis],
+                    -diff[:, np.newaxis, :, :], out=H)
+        for a in range(D):
+            H[:, a, :, a] += 1
+        H /= self.l**2
+        K *= k[:, np.newaxis, :, np.newaxis]
+        return K.reshape(n * D1, n * D1)
 
     def kernel_vector(self, x, X, nsample):
-        return np.hstack([self.kernel(x, x2) for x2 in X])
+        n, D = np.atleast_2d(X).shape
+        D1 = D + 1
+
+        # Scaled differences (x - x_i) / l to all data points at once:
+        diff = (x - X) / self.l
+        k = self.weight**2 * np.exp(-0.5 * np.sum(diff**2, axis=1))
+
+        # Block i of the result is K[:, i, :] = self.kernel(x, X[i]):
+        K = np.empty((D1, n, D1))
+        K[0, :, 0] = 1
+        K[0, :, 1:] = diff / self.l
+        K[1:, :, 0] = -diff.T / self.l
+        H = K[1:, :, 1:]
+        np.multiply(diff.T[:, :, np.newaxis], -diff[np.newaxis, :, :], out=H)
+        for a in range(D):
+            H[a, :, a] += 1
+        H /= self.l**2
+        K *= k[np.newaxis, :, np.newaxis]
+        return K.reshape(D1, n * D1)
 
     # ---------Derivatives--------
     def dK_dweight(self, X):
         """Return the derivative of K(X,X) respect to the weight """
-        return self.K(X, X)*2/self.weight
+        return self.kernel_matrix(X)*2/self.weight
 
     # ----Derivatives of the kernel function respect to the scale ---
     def dK_dl_k(self, x1, x2):
@@ -185,7 +212,32 @@ class SquaredExponential(SE_kernel):
 
     def dK_dl(self, X):
         """Return the derivative of K(X,X) respect of l"""
-        return np.block([[self.dK_dl_matrix(x1, x2) for x2 in X] for x1 in X])
+        X = np.atleast_2d(X)
+        n, D = X.shape
+        D1 = D + 1
+
+        # Quantities shared by all blocks, computed once for all pairs
+        # instead of once per dK_dl_* call:
+        diff = (X[:, np.newaxis, :] - X[np.newaxis, :, :]) / self.l
+        sqd = np.sum(diff**2, axis=2)
+        k = self.weight**2 * np.exp(-0.5 * sqd)
+        prefactor = 1 - 0.5 * sqd
+
+        # Block (i, j) of dK is dK[i, :, j, :] = self.dK_dl_matrix(X[i], X[j]):
+        dK = np.empty((n, D1, n, D1))
+        dK[:, 0, :, 0] = sqd / self.l
+        j = 2 * prefactor[:, :, np.newaxis] * diff / self.l**2
+        dK[:, 0, :, 1:] = -j
+        dK[:, 1:, :, 0] = j.transpose(0, 2, 1)
+        H = dK[:, 1:, :, 1:]
+        np.multiply(diff.transpose(0, 2, 1)[:, :, :, np.newaxis],
+                    diff[:, np.newaxis, :, :], out=H)
+        H *= (1 + prefactor)[:, np.newaxis, :, np.newaxis]
+        for a in range(D):
+            H[:, a, :, a] -= prefactor
+        H *= 2 / self.l**3
+        dK *= k[:, np.newaxis, :, np.newaxis]
+        return dK.reshape(n * D1, n * D1)
 
     def gradient(self, X):
         """Computes the gradient of matrix K given the data respect to the
@@ -1,6 +1,7 @@
 from typing import List, Sequence, Set, Dict, Union, Iterator
 import warnings
 import collections.abc
+import functools
 
 import numpy as np
 
@@ -8,6 +9,13 @@ from ase.data import atomic_numbers, chemical_symbols
 from ase.formula import Formula
 
 
+# Chemical symbols as an object array, for fancy indexing by atomic number:
+_chemical_symbols = np.array(chemical_symbols, dtype=object)
+
+# Do not cache formulas of structures larger than this:
+_MAX_CACHED_NUMBERS = 10000
+
+
 def string2symbols(s: str) -> List[str]:
     """Convert string to list of chemical symbols."""
     return list(Formula(s))
@@ -25,6 +33,18 @@ def symbols2numbers(symbols) -> List[int]:
     return numbers
 
 
+def _format_numbers(numbers: bytes, mode: str, empirical: bool) -> str:
+    """Hill or metal formula of atomic numbers given as raw bytes."""
+    symbols = _chemical_symbols[np.frombuffer(numbers, int)].tolist()
+    f = Formula('', _tree=[(symbols, 1)])
+    if empirical:
+        f, _ = f.reduce()
+    return f.format(mode)
+
+
+_format_numbers_cached = functools.lru_cache(maxsize=128)(_format_numbers)
+
+
 class Symbols(collections.abc.Sequence):
     """A sequence of chemical symbols.
 
@@ -71,7 +91,7 @@ class Symbols(collections.abc.Sequence):
 
     def __getitem__(self, key) -> Union['Symbols', str]:
         num = self.numbers[key]
-        if np.isscalar(num):
+        if isinstance(num, np.integer):
             return chemical_symbols[num]
         return Symbols(num)
 
@@ -127,10 +147,14 @@ class Symbols(collections.abc.Sequence):
 
         if mode == 'reduce':
             n = len(numbers)
-            changes = np.concatenate(([0], np.arange(1, n)[numbers[1:] !=
-                                                           numbers[:-1]]))
-            symbols = [chemical_symbols[e] for e in numbers[changes]]
-            counts = np.append(changes[1:], n) - changes
+            changes = np.flatnonzero(numbers[1:] != numbers[:-1]) + 1
+            # Start and end indices of each run of identical numbers:
+            bounds = np.empty(len(changes) + 2, dtype=np.intp)
+            bounds[0] = 0
+            bounds[1:-1] = changes
+            bounds[-1] = n
+            symbols = _chemical_symbols[numbers[bounds[:-1]]]
+            counts = np.diff(bounds)
 
             tokens = []
             for s, c in zip(symbols, counts):
@@ -139,30 +163,27 @@ class Symbols(collections.abc.Sequence):
                     tokens.append(str(c))
             formula = ''.join(tokens)
         elif mode == 'all':
-            formula = ''.join([chemical_symbols[n] for n in numbers])
+            formula = ''.join(_chemical_symbols[numbers])
         else:
-            symbols = [chemical_symbols[Z] for Z in numbers]
-            f = Formula('', _tree=[(symbols, 1)])
-            if empirical:
-                f, _ = f.reduce()
-            if mode in {'hill', 'metal'}:
-                formula = f.format(mode)
-            else:
+            if mode not in {'hill', 'metal'}:
                 raise ValueError(
                     "Use mode = 'all', 'reduce', 'hill' or 'metal'.")
+            if len(numbers) > _MAX_CACHED_NUMBERS:
+                format_numbers = _format_numbers
+            else:
+                format_numbers = _format_numbers_cached
+            formula = format_numbers(numbers.tobytes(), mode, empirical)
 
         return formula
 
     def search(self, symbols) -> Sequence[int]:
         """Return the indices of elements with given symbol or symbols."""
-        numbers = set(symbols2numbers(symbols))
-        indices = [i for i, number in enumerate(self.numbers)
-                   if number in numbers]
-        return np.array(indices, int)
+        numbers = symbols2numbers(symbols)
+        return np.flatnonzero(np.isin(self.numbers, numbers))
 
     def species(self) -> Set[str]:
         """Return unique symbols as a set."""
-        return set(self)
+        return set(chemical_symbols[Z] for Z in np.unique(self.numbers))
 
     def indices(self) -> Dict[str, Sequence[int]]:
         """Return dictionary mapping each unique symbol to indices.
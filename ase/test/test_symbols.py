@@ -84,3 +84,11 @@ def test_symbols_to_formula():
     symstr = 'CH3CH2OH'
     symbols = Symbols.fromsymbols(symstr)
     assert str(symbols.formula) == symstr
+
+
+def test_formula_cache_follows_numbers(atoms):
+    assert atoms.symbols.get_chemical_formula() == 'C2H6O'
+    atoms.symbols[-1] = 'Cl'
+    assert atoms.symbols.get_chemical_formula() == 'C2H5ClO'
+    assert atoms.symbols.get_chemical_formula('metal') == 'C2ClH5O'
+    assert atoms.symbols.get_chemical_formula(empirical=True) == 'C2H5ClO'